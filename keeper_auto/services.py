@@ -6,7 +6,7 @@ These services contain the core business logic and interact with the Keeper vaul
 import csv
 import json
 from pathlib import Path
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Iterable, Optional, Sequence, Set
 
 from .models import (
     VaultData, ValidationResult, ConfigRecord
@@ -366,47 +366,62 @@ class ValidationService:
         try:
             with open(csv_path, 'r', newline='', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
-
-                if not reader.fieldnames:
-                    result.add_error("CSV file is empty or missing headers.")
-                    return result
-
-                # Normalize headers (case-insensitive, strip)
-                headers = [h.strip() for h in reader.fieldnames]
-
-                required_columns = {"record_uid", "title", "folder_path"}
-                missing_required = required_columns - {h.lower() for h in headers}
-                if missing_required:
-                    result.add_error(f"Missing required column(s): {', '.join(sorted(missing_required))}.")
-
-                seen_record_uids: Set[str] = set()
-                row_idx = 1  # start after header
-
-                for row in reader:
-                    row_idx += 1
-                    uid_raw = (row.get('record_uid') or '').strip()
-                    if not uid_raw:
-                        result.add_error(f"Row {row_idx}: 'record_uid' is blank.")
-                    else:
-                        if uid_raw in seen_record_uids:
-                            result.add_error(f"Duplicate record_uid '{uid_raw}' at row {row_idx}.")
-                        seen_record_uids.add(uid_raw)
-
-                    # Iterate team permission cells
-                    for col, val in row.items():
-                        if col in ('record_uid', 'title', 'folder_path'):
-                            continue
-                        token = (val or '').strip().lower()
-                        if token and token not in _ALLOWED_PERMISSION_TOKENS:
-                            result.add_error(f"Row {row_idx}: invalid permission token '{val}' in column '{col}'.")
-
-                row_count = row_idx - 1
-                result.metadata['row_count'] = row_count
-
-                if row_count > max_records:
-                    result.add_warning(f"CSV has {row_count} records, exceeding max-records limit of {max_records}.")
+                self._validate_rows(reader.fieldnames, reader, max_records, result)
 
         except Exception as e:
             result.add_error(f"Failed to read or validate CSV: {e}")
 
+        return result
+
+    def _validate_rows(
+        self,
+        fieldnames: Optional[Sequence[str]],
+        rows: Iterable[Dict[str, str]],
+        max_records: int,
+        result: Optional[ValidationResult] = None,
+    ) -> ValidationResult:
+        """Validate already-parsed CSV headers and rows, adding findings to result."""
+
+        if result is None:
+            result = ValidationResult(is_valid=True)
+
+        if not fieldnames:
+            result.add_error("CSV file is empty or missing headers.")
+            return result
+
+        # Normalize headers (case-insensitive, strip)
+        headers = [h.strip() for h in fieldnames]
+
+        required_columns = {"record_uid", "title", "folder_path"}
+        missing_required = required_columns - {h.lower() for h in headers}
+        if missing_required:
+            result.add_error(f"Missing required column(s): {', '.join(sorted(missing_required))}.")
+
+        seen_record_uids: Set[str] = set()
+        row_idx = 1  # start after header
+
+        for row in rows:
+            row_idx += 1
+            uid_raw = (row.get('record_uid') or '').strip()
+            if not uid_raw:
+                result.add_error(f"Row {row_idx}: 'record_uid' is blank.")
+            else:
+                if uid_raw in seen_record_uids:
+                    result.add_error(f"Duplicate record_uid '{uid_raw}' at row {row_idx}.")
+                seen_record_uids.add(uid_raw)
+
+            # Iterate team permission cells
+            for col, val in row.items():
+                if col in ('record_uid', 'title', 'folder_path'):
+                    continue
+                token = (val or '').strip().lower()
+                if token and token not in _ALLOWED_PERMISSION_TOKENS:
+                    result.add_error(f"Row {row_idx}: invalid permission token '{val}' in column '{col}'.")
+
+        row_count = row_idx - 1
+        result.metadata['row_count'] = row_count
+
+        if row_count > max_records:
+            result.add_warning(f"CSV has {row_count} records, exceeding max-records limit of {max_records}.")
+
         return result 
\ No newline at end of file
@@ -0,0 +1,203 @@
+"""Shared pytest fixtures for the keeper_auto test-suite."""
+
+import copy
+import os
+import pickle
+from types import SimpleNamespace
+
+import pytest
+
+from keeper_auto.models import ConfigRecord, OperationResult, ValidationResult, VaultData
+from tests.constants import (
+    FOLDER_NAME, FOLDER_UID, RECORD_PATH, RECORD_TITLE, RECORD_UID, SECOND_RECORD_PATH,
+    SECOND_RECORD_TITLE, SECOND_RECORD_UID, SECOND_TEAM_NAME, SECOND_TEAM_UID, TEAM_NAME, TEAM_UID,
+)
+
+
+_BACKEND_FUNCTIONS = ("get_records", "get_record", "get_folder_data", "get_teams")
+
+
+class FakeKeeperBackend:
+    """Canned responses for the Keeper client functions used by the services.
+
+    Set ``<name>_value`` to control what a function returns, or
+    ``<name>_exc`` to make it raise instead.
+    """
+
+    def __init__(self):
+        self.get_records_value = []
+        self.get_records_exc = None
+        self.get_record_value = None
+        self.get_record_exc = None
+        self.get_folder_data_value = {"folders": [], "records": []}
+        self.get_folder_data_exc = None
+        self.get_teams_value = []
+        self.get_teams_exc = None
+
+    def _stub(self, name):
+        def _call(*args, **kwargs):
+            exc = getattr(self, f"{name}_exc")
+            if exc:
+                raise exc
+            return getattr(self, f"{name}_value")
+        return _call
+
+
+@pytest.fixture(autouse=True)
+def _pause_coverage_for_untraced(request):
+    """Stop coverage tracing around tests marked ``untraced``.
+
+    A no-op when coverage is not installed or not running (e.g. ``--no-cov``).
+    """
+    if request.node.get_closest_marker("untraced") is None:
+        yield
+        return
+    try:
+        from coverage import Coverage
+    except ImportError:
+        yield
+        return
+    cov = Coverage.current()
+    if cov is None:
+        yield
+        return
+    cov.stop()
+    try:
+        yield
+    finally:
+        cov.start()
+
+
+@pytest.fixture(scope="session")
+def fake_sdk():
+    """Lightweight stand-in for the Keeper SDK params object.
+
+    Shared across the session; reset its caches before each test that uses it.
+    """
+    return SimpleNamespace(record_cache={}, team_cache={})
+
+
+@pytest.fixture(scope="session")
+def models():
+    """The keeper_auto.models module, for tests that reference model classes."""
+    import keeper_auto.models
+
+    return keeper_auto.models
+
+
+@pytest.fixture(scope="session")
+def exceptions():
+    """The keeper_auto.exceptions module, for tests that reference exception classes."""
+    import keeper_auto.exceptions
+
+    return keeper_auto.exceptions
+
+
+@pytest.fixture(scope="module")
+def empty_vault():
+    """Freshly constructed VaultData shared per module; do not mutate."""
+    return VaultData()
+
+
+@pytest.fixture(scope="module")
+def populated_vault():
+    """Loaded VaultData with two teams, one folder and two records, shared per module.
+
+    Do not mutate; deep-copy it first.
+    """
+    vault_data = VaultData()
+    vault_data.add_team(TEAM_UID, TEAM_NAME)
+    vault_data.add_team(SECOND_TEAM_UID, SECOND_TEAM_NAME)
+    vault_data.add_folder(FOLDER_UID, FOLDER_NAME, None)
+    vault_data.add_record(RECORD_UID, RECORD_TITLE, RECORD_PATH)
+    vault_data.add_record(SECOND_RECORD_UID, SECOND_RECORD_TITLE, SECOND_RECORD_PATH)
+    vault_data.mark_loaded()
+    return vault_data
+
+
+@pytest.fixture(scope="module")
+def minimal_op_result():
+    """Successful OperationResult with only the required fields, shared per module; do not mutate."""
+    return OperationResult(success=True, message="Success")
+
+
+@pytest.fixture(scope="module")
+def full_op_result():
+    """Failed OperationResult with every field set, shared per module; do not mutate."""
+    return OperationResult(
+        success=False,
+        message="Failed",
+        data={"key": "value"},
+        errors=["Error 1", "Error 2"],
+        warnings=["Warning 1"],
+    )
+
+
+@pytest.fixture(scope="module")
+def empty_validation_result():
+    """Valid ValidationResult with no findings, shared per module; do not mutate."""
+    return ValidationResult(is_valid=True)
+
+
+@pytest.fixture(scope="session")
+def missing_csv(tmp_path_factory):
+    """Path to a CSV file that is guaranteed not to exist."""
+    return tmp_path_factory.mktemp("missing") / "nonexistent.csv"
+
+
+@pytest.fixture
+def keeper_backend(monkeypatch):
+    """Replace the Keeper client surface with a FakeKeeperBackend."""
+    # Imported lazily so model-only test modules do not require keepercommander.
+    from keeper_auto import keeper_client, services
+
+    backend = FakeKeeperBackend()
+    for name in _BACKEND_FUNCTIONS:
+        stub = backend._stub(name)
+        # Services import some helpers at call time, so patch the source too.
+        monkeypatch.setattr(keeper_client, name, stub)
+        if hasattr(services, name):
+            monkeypatch.setattr(services, name, stub)
+    return backend
+
+
+def _load_live_vault_data():
+    from keeper_auto.services import VaultService
+
+    vault_service = VaultService(ConfigRecord())
+    vault_data = vault_service.load_vault_data(force_reload=True)
+    if vault_data is None:
+        pytest.fail("Could not load live vault data from the Keeper API")
+    return copy.deepcopy(vault_data)
+
+
+@pytest.fixture(scope="session")
+def live_vault_data(tmp_path_factory):
+    """Live, uncached vault data loaded once per test session.
+
+    Shared by every integration test, so treat it as read-only. It is a deep
+    copy, detached from the VaultService that loaded it. Under pytest-xdist
+    the first worker pickles it next to the per-worker temp dirs so the
+    others reuse it instead of hitting the API again.
+    """
+    # Without xdist the basetemp parent outlives the run, so never cache there.
+    if not os.environ.get("PYTEST_XDIST_WORKER"):
+        return _load_live_vault_data()
+
+    from filelock import FileLock
+
+    cache_file = tmp_path_factory.getbasetemp().parent / "live_vault_data.pickle"
+    with FileLock(f"{cache_file}.lock"):
+        if cache_file.is_file():
+            return pickle.loads(cache_file.read_bytes())
+        vault_data = _load_live_vault_data()
+        cache_file.write_bytes(pickle.dumps(vault_data))
+        return vault_data
+
+
+@pytest.fixture
+def vault_service():
+    """Fresh default-config VaultService per test; tests mutate its vault_data."""
+    from keeper_auto.services import VaultService
+
+    return VaultService(ConfigRecord())
@@ -0,0 +1,16 @@
+"""Shared constants for the keeper_auto test-suite."""
+
+import csv
+
+# Dialect shared by every CSV writer in the tests; resolved once at import.
+CSV_DIALECT = csv.excel
+
+# VaultData.summary() of a vault with nothing added; compare only, never mutate.
+EXPECTED_EMPTY_SUMMARY = {"teams": 0, "records": 0, "folders": 0}
+
+# Contents of the populated_vault fixture, shared with the tests that query it.
+TEAM_UID, TEAM_NAME = "team1", "Team One"
+SECOND_TEAM_UID, SECOND_TEAM_NAME = "team2", "Team Two"
+FOLDER_UID, FOLDER_NAME = "folder1", "Folder One"
+RECORD_UID, RECORD_TITLE, RECORD_PATH = "record1", "Record One", "/path"
+SECOND_RECORD_UID, SECOND_RECORD_TITLE, SECOND_RECORD_PATH = "record2", "Record Two", "/another/path"
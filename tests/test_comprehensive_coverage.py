@@ -20,6 +20,7 @@ from keeper_auto.exceptions import (
     APIError, AuthenticationError, ConfigurationError, ValidationError,
     OperationError, DataError, NetworkError, PermissionError
 )
+from tests.constants import CSV_DIALECT, EXPECTED_EMPTY_SUMMARY
 
 
 class TestExceptions:
@@ -93,7 +94,7 @@ class TestModels:
         
         # Test initial state
         assert not vault_data.is_loaded()
-        assert vault_data.summary() == {"teams": 0, "folders": 0, "records": 0}
+        assert vault_data.summary() == EXPECTED_EMPTY_SUMMARY
         assert vault_data.get_team_by_uid("nonexistent") is None
         assert vault_data.find_folder_by_uid("nonexistent") is None
         assert vault_data.get_record_by_uid("nonexistent") is None
@@ -540,7 +541,7 @@ class TestProvisioningService:
         
         csv_file = tmp_path / "test.csv"
         with open(csv_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=csv_data[0].keys())
+            writer = csv.DictWriter(f, fieldnames=csv_data[0].keys(), dialect=CSV_DIALECT)
             writer.writeheader()
             writer.writerows(csv_data)
         
@@ -621,7 +622,7 @@ class TestProvisioningService:
         
         csv_file = tmp_path / "test.csv"
         with open(csv_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=csv_data[0].keys())
+            writer = csv.DictWriter(f, fieldnames=csv_data[0].keys(), dialect=CSV_DIALECT)
             writer.writeheader()
             writer.writerows(csv_data)
         
@@ -639,7 +640,7 @@ class TestProvisioningService:
         # Create invalid CSV (missing required headers)
         csv_file = tmp_path / "invalid.csv"
         with open(csv_file, 'w', newline='') as f:
-            writer = csv.writer(f)
+            writer = csv.writer(f, dialect=CSV_DIALECT)
             writer.writerow(["invalid_header"])
             writer.writerow(["invalid_data"])
         
@@ -686,7 +687,7 @@ class TestProvisioningService:
         
         csv_file = tmp_path / "test.csv"
         with open(csv_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=csv_data[0].keys())
+            writer = csv.DictWriter(f, fieldnames=csv_data[0].keys(), dialect=CSV_DIALECT)
             writer.writeheader()
             writer.writerows(csv_data)
         
@@ -714,7 +715,7 @@ class TestProvisioningService:
         
         csv_file = tmp_path / "test.csv"
         with open(csv_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=csv_data[0].keys())
+            writer = csv.DictWriter(f, fieldnames=csv_data[0].keys(), dialect=CSV_DIALECT)
             writer.writeheader()
             writer.writerows(csv_data)
         
@@ -736,7 +737,7 @@ class TestProvisioningService:
         
         csv_file = tmp_path / "test.csv"
         with open(csv_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=csv_data[0].keys())
+            writer = csv.DictWriter(f, fieldnames=csv_data[0].keys(), dialect=CSV_DIALECT)
             writer.writeheader()
             writer.writerows(csv_data)
         
@@ -762,7 +763,7 @@ class TestProvisioningService:
         
         csv_file = tmp_path / "test.csv"
         with open(csv_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=csv_data[0].keys())
+            writer = csv.DictWriter(f, fieldnames=csv_data[0].keys(), dialect=CSV_DIALECT)
             writer.writeheader()
             writer.writerows(csv_data)
         
@@ -784,7 +785,7 @@ class TestProvisioningService:
         
         csv_file = tmp_path / "test.csv"
         with open(csv_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=csv_data[0].keys())
+            writer = csv.DictWriter(f, fieldnames=csv_data[0].keys(), dialect=CSV_DIALECT)
             writer.writeheader()
             writer.writerows(csv_data)
         
@@ -795,13 +796,11 @@ class TestProvisioningService:
             assert not result.success
             assert any("Failed to process record" in error for error in result.errors)
     
-    def test_apply_changes_general_exception(self, tmp_path):
+    def test_apply_changes_general_exception(self, missing_csv):
         service = ProvisioningService(VaultService())
-        
-        csv_file = tmp_path / "nonexistent.csv"  # File doesn't exist
         config = ConfigRecord()
         
-        result = service.apply_changes(csv_file, config)
+        result = service.apply_changes(missing_csv, config)
         assert not result.success
         assert "Failed to apply changes" in result.message
 
@@ -809,9 +808,9 @@ class TestProvisioningService:
 class TestValidationService:
     """Test ValidationService comprehensive functionality."""
     
-    def test_validate_csv_file_not_found(self):
+    def test_validate_csv_file_not_found(self, missing_csv):
         service = ValidationService()
-        result = service.validate_csv_file(Path("nonexistent.csv"))
+        result = service.validate_csv_file(missing_csv)
         
         assert not result.is_valid
         assert any("not found" in error for error in result.errors)
@@ -831,7 +830,7 @@ class TestValidationService:
         
         csv_file = tmp_path / "missing_headers.csv"
         with open(csv_file, 'w', newline='') as f:
-            writer = csv.writer(f)
+            writer = csv.writer(f, dialect=CSV_DIALECT)
             writer.writerow(["record_uid", "title"])  # Missing folder_path
             writer.writerow(["uid1", "Title 1"])
         
@@ -844,7 +843,7 @@ class TestValidationService:
         
         csv_file = tmp_path / "empty_rows.csv"
         with open(csv_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=["record_uid", "title", "folder_path"])
+            writer = csv.DictWriter(f, fieldnames=["record_uid", "title", "folder_path"], dialect=CSV_DIALECT)
             writer.writeheader()
             # No data rows
         
@@ -856,16 +855,14 @@ class TestValidationService:
         service = ValidationService()
         
         csv_file = tmp_path / "large.csv"
-        with open(csv_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=["record_uid", "title", "folder_path"])
+        with open(csv_file, 'w', newline='', buffering=1 << 16) as f:
+            writer = csv.DictWriter(f, fieldnames=["record_uid", "title", "folder_path"], dialect=CSV_DIALECT)
             writer.writeheader()
             # Write more than 1000 rows
-            for i in range(1001):
-                writer.writerow({
-                    "record_uid": f"uid{i}",
-                    "title": f"Title {i}",
-                    "folder_path": f"/path{i}"
-                })
+            writer.writerows([
+                {"record_uid": f"uid{i}", "title": f"Title {i}", "folder_path": f"/path{i}"}
+                for i in range(1001)
+            ])
         
         result = service.validate_csv_file(csv_file)
         assert result.is_valid
@@ -877,7 +874,7 @@ class TestValidationService:
         
         csv_file = tmp_path / "no_teams.csv"
         with open(csv_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=["record_uid", "title", "folder_path"])
+            writer = csv.DictWriter(f, fieldnames=["record_uid", "title", "folder_path"], dialect=CSV_DIALECT)
             writer.writeheader()
             writer.writerow({"record_uid": "uid1", "title": "Title 1", "folder_path": "/path"})
         
@@ -890,7 +887,7 @@ class TestValidationService:
         
         csv_file = tmp_path / "invalid_perms.csv"
         with open(csv_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=["record_uid", "title", "folder_path", "Team1"])
+            writer = csv.DictWriter(f, fieldnames=["record_uid", "title", "folder_path", "Team1"], dialect=CSV_DIALECT)
             writer.writeheader()
             writer.writerow({
                 "record_uid": "uid1",
@@ -908,7 +905,7 @@ class TestValidationService:
         
         csv_file = tmp_path / "missing_uid.csv"
         with open(csv_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=["record_uid", "title", "folder_path"])
+            writer = csv.DictWriter(f, fieldnames=["record_uid", "title", "folder_path"], dialect=CSV_DIALECT)
             writer.writeheader()
             writer.writerow({"record_uid": "", "title": "Title 1", "folder_path": "/path"})
         
@@ -924,7 +921,7 @@ class TestValidationService:
         
         csv_file = tmp_path / "unknown_teams.csv"
         with open(csv_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=["record_uid", "title", "folder_path", "Known Team", "Unknown Team"])
+            writer = csv.DictWriter(f, fieldnames=["record_uid", "title", "folder_path", "Known Team", "Unknown Team"], dialect=CSV_DIALECT)
             writer.writeheader()
             writer.writerow({
                 "record_uid": "uid1",
@@ -946,7 +943,7 @@ class TestValidationService:
         
         csv_file = tmp_path / "missing_record.csv"
         with open(csv_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=["record_uid", "title", "folder_path"])
+            writer = csv.DictWriter(f, fieldnames=["record_uid", "title", "folder_path"], dialect=CSV_DIALECT)
             writer.writeheader()
             writer.writerow({
                 "record_uid": "nonexistent_uid",
@@ -966,7 +963,7 @@ class TestValidationService:
         
         csv_file = tmp_path / "drift.csv"
         with open(csv_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=["record_uid", "title", "folder_path"])
+            writer = csv.DictWriter(f, fieldnames=["record_uid", "title", "folder_path"], dialect=CSV_DIALECT)
             writer.writeheader()
             writer.writerow({
                 "record_uid": "uid1",
@@ -996,7 +993,7 @@ class TestValidationService:
         
         csv_file = tmp_path / "metadata_test.csv"
         with open(csv_file, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=["record_uid", "title", "folder_path", "Team1", "Team2"])
+            writer = csv.DictWriter(f, fieldnames=["record_uid", "title", "folder_path", "Team1", "Team2"], dialect=CSV_DIALECT)
             writer.writeheader()
             writer.writerow({"record_uid": "uid1", "title": "Title 1", "folder_path": "/path", "Team1": "ro", "Team2": "rw"})
             writer.writerow({"record_uid": "uid2", "title": "Title 2", "folder_path": "/path", "Team1": "rws", "Team2": "ro"})
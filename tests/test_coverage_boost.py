@@ -3,12 +3,9 @@ Comprehensive test suite to boost code coverage for keeper_auto package.
 This file focuses on testing all the uncovered lines and edge cases.
 """
 
-import csv
-import json
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+import dataclasses
+from collections import namedtuple
 import pytest
-import tempfile
 
 from keeper_auto.models import (
     VaultData, ValidationResult, OperationResult, CSVTemplate, ConfigRecord,
@@ -21,10 +18,132 @@ from keeper_auto.exceptions import (
     APIError, AuthenticationError, ConfigurationError, ValidationError,
     OperationError, DataError, NetworkError, PermissionError
 )
+from tests.constants import EXPECTED_EMPTY_SUMMARY
 
 
+class _FakeField:
+    """Minimal stand-in for a Keeper record field."""
+    __slots__ = ("type", "value")
+
+    def __init__(self, type, value):
+        self.type = type
+        self.value = value
+
+
+class _FakeRecord:
+    """Minimal stand-in for a Keeper record returned by get_record()."""
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = data
+
+
+_VALID_CONFIG_JSON = (
+    '{"root_folder_name": "[Test]", "included_teams": ["team1"], '
+    '"included_folders": ["folder1"], "excluded_folders": ["folder2"]}'
+)
+
+# Canned get_folder_data() payloads. load_vault_data only reads these, so
+# they are shared across test runs rather than rebuilt per test.
+_EMPTY_DATA = {"folders": [], "records": []}
+
+_FORCE_RELOAD_DATA = {
+    "folders": [
+        {"uid": "folder1", "name": "Folder 1", "parent_uid": None}
+    ],
+    "records": [
+        {"uid": "record1", "title": "Record 1", "folder_uid": "folder1"}
+    ]
+}
+
+_FILTERED_DATA = {
+    "folders": [
+        {"uid": "folder1", "name": "Included Folder", "parent_uid": None},
+        {"uid": "folder2", "name": "Excluded Folder", "parent_uid": None},
+        {"uid": "folder3", "name": "Not Included Folder", "parent_uid": None}
+    ],
+    "records": [
+        {"uid": "record1", "title": "Record 1", "folder_uid": "folder1"}
+    ]
+}
+
+_MISSING_UID_DATA = {
+    "folders": [
+        {"name": "Folder 1", "parent_uid": None},  # Missing uid
+        {"uid": "folder2", "parent_uid": None}      # Missing name
+    ],
+    "records": [
+        {"title": "Record 1", "folder_uid": "folder1"},  # Missing uid
+        {"uid": "record2", "folder_uid": "folder1"}       # Missing title
+    ]
+}
+
+
+VaultLoadCase = namedtuple(
+    "VaultLoadCase",
+    "name folders teams config force_reload api_exc "
+    "expect_teams expect_folders expect_records xfail",
+    defaults=(ConfigRecord(), False, None, None, None, None, None),
+)
+
+VAULT_LOAD_CASES = (
+    VaultLoadCase(
+        name="force_reload",
+        folders=_FORCE_RELOAD_DATA,
+        teams=[
+            {"team_uid": "team1", "team_name": "Team 1"}
+        ],
+        force_reload=True,
+        expect_teams=["team1"],
+        expect_records=["record1"],
+    ),
+    VaultLoadCase(
+        name="config_filtering",
+        folders=_FILTERED_DATA,
+        teams=[
+            {"team_uid": "team1", "team_name": "Included Team"},
+            {"team_uid": "team2", "team_name": "Not Included Team"}
+        ],
+        config=ConfigRecord(
+            included_teams=["team1"],
+            included_folders=["folder1"],
+            excluded_folders=["folder2"]
+        ),
+        # Only team1 is included; folder2 is excluded and folder3 not included
+        expect_teams=["team1"],
+        expect_folders=["folder1"],
+        expect_records=["record1"],
+        xfail="load_vault_data filters teams but not folders yet",
+    ),
+    VaultLoadCase(
+        name="missing_uids",
+        folders=_MISSING_UID_DATA,
+        teams=[
+            {"team_name": "Team 1"},  # Missing team_uid
+            {"team_uid": "team2"}     # Missing team_name
+        ],
+        # Items with missing required fields are skipped
+        expect_teams=[],
+        expect_folders=[],
+        expect_records=[],
+    ),
+    VaultLoadCase(
+        name="api_exception",
+        folders=_EMPTY_DATA,
+        teams=[],
+        # API failures are swallowed and reported as a None result
+        api_exc=Exception("API Error"),
+    ),
+)
+
+
+@pytest.mark.untraced
 class TestExceptionCoverage:
-    """Test all exception classes for full coverage."""
+    """Test all exception classes.
+
+    Untraced: the exception constructors are already covered by
+    test_models_comprehensive.py.
+    """
     
     def test_api_error_with_error_code(self):
         error = APIError("Test API error", error_code="E001")
@@ -98,42 +217,27 @@ class TestModelCoverage:
         assert config.included_folders == ["folder1"]
         assert config.excluded_folders == ["folder2", "folder3"]
     
-    def test_vault_folder_model(self):
-        """Test VaultFolder model."""
-        # Test folder with parent
-        folder = VaultFolder(uid="folder1", name="Folder One", parent_uid="parent1")
-        assert folder.uid == "folder1"
-        assert folder.name == "Folder One"
-        assert folder.parent_uid == "parent1"
-        assert str(folder) == "Folder One"
-        assert hash(folder) == hash("folder1")
-        
-        # Test root folder
+    @pytest.mark.parametrize("obj,str_val,hash_val", [
+        (VaultFolder(uid="folder1", name="Folder One", parent_uid="parent1"), "Folder One", "folder1"),
+        (Record(uid="record1", title="Test Record", folder_path="/test/path"), "Test Record", "record1"),
+        (Team(uid="team1", name="Test Team"), "Test Team", "team1"),
+    ], ids=["folder", "record", "team"])
+    def test_model_str_hash(self, obj, str_val, hash_val):
+        """Test models render their display name and hash by UID."""
+        assert str(obj) == str_val
+        assert hash(obj) == hash(hash_val)
+    
+    def test_vault_folder_defaults(self):
+        """Test VaultFolder defaults for a root folder."""
         root_folder = VaultFolder(uid="root", name="Root")
         assert root_folder.parent_uid is None
         assert len(root_folder.subfolders) == 0
         assert len(root_folder.records) == 0
     
-    def test_record_model(self):
-        """Test Record model."""
-        record = Record(uid="record1", title="Test Record", folder_path="/test/path")
-        assert record.uid == "record1"
-        assert record.title == "Test Record"
-        assert record.folder_path == "/test/path"
-        assert str(record) == "Test Record"
-        assert hash(record) == hash("record1")
-        
-        # Test record with default folder path
-        record2 = Record(uid="record2", title="Test Record 2")
-        assert record2.folder_path == ""
-    
-    def test_team_model(self):
-        """Test Team model."""
-        team = Team(uid="team1", name="Test Team")
-        assert team.uid == "team1"
-        assert team.name == "Test Team"
-        assert str(team) == "Test Team"
-        assert hash(team) == hash("team1")
+    def test_record_default_folder_path(self):
+        """Test Record defaults to an empty folder path."""
+        record = Record(uid="record2", title="Test Record 2")
+        assert record.folder_path == ""
     
     def test_permission_model(self):
         """Test Permission model."""
@@ -163,14 +267,16 @@ class TestModelCoverage:
         assert perm_dict["can_edit"] is True
         assert perm_dict["manage_records"] is True
     
-    def test_permission_from_csv_row(self):
+    @pytest.fixture
+    def perm_fixtures(self):
+        """Team and record lookups shared by the from_csv_row tests."""
+        return {
+            "teams": {"team1": Team(uid="team1", name="Test Team")},
+            "records": {"record1": Record(uid="record1", title="Test Record")},
+        }
+    
+    def test_permission_from_csv_row(self, perm_fixtures):
         """Test Permission.from_csv_row method."""
-        team = Team(uid="team1", name="Test Team")
-        record = Record(uid="record1", title="Test Record")
-        
-        teams = {"team1": team}
-        records = {"record1": record}
-        
         # Test with valid permissions
         row = {
             "record_uid": "record1",
@@ -180,7 +286,9 @@ class TestModelCoverage:
             "Test_manage_users": "false"
         }
         
-        permissions = Permission.from_csv_row(teams, records, "record1", row)
+        permissions = Permission.from_csv_row(
+            perm_fixtures["teams"], perm_fixtures["records"], "record1", row
+        )
         assert len(permissions) == 1
         
         perm = permissions[0]
@@ -191,43 +299,27 @@ class TestModelCoverage:
         assert perm.manage_records is True
         assert perm.manage_users is False
     
-    def test_permission_from_csv_row_invalid_record(self):
-        """Test Permission.from_csv_row with invalid record."""
-        teams = {"team1": Team(uid="team1", name="Test Team")}
-        records = {"record1": Record(uid="record1", title="Test Record")}
-        
-        permissions = Permission.from_csv_row(teams, records, "nonexistent", {})
-        assert len(permissions) == 0
-    
-    def test_permission_from_csv_row_invalid_team(self):
-        """Test Permission.from_csv_row with invalid team."""
-        teams = {"team1": Team(uid="team1", name="Test Team")}
-        records = {"record1": Record(uid="record1", title="Test Record")}
-        
-        row = {
-            "record_uid": "record1",
-            "NonexistentTeam_can_edit": "true"
-        }
-        
-        permissions = Permission.from_csv_row(teams, records, "record1", row)
-        assert len(permissions) == 0
-    
-    def test_permission_from_csv_row_invalid_values(self):
-        """Test Permission.from_csv_row with invalid permission values."""
-        team = Team(uid="team1", name="Test Team")
-        record = Record(uid="record1", title="Test Record")
-        
-        teams = {"team1": team}
-        records = {"record1": record}
-        
-        row = {
-            "record_uid": "record1",
-            "Test_can_edit": "invalid_value",
-            "Test_can_share": "maybe"
-        }
-        
-        permissions = Permission.from_csv_row(teams, records, "record1", row)
-        assert len(permissions) == 0
+    @pytest.mark.parametrize("record_uid,row,expected_len", [
+        pytest.param("nonexistent", {}, 0, id="invalid-record"),
+        pytest.param(
+            "record1",
+            {"record_uid": "record1", "NonexistentTeam_can_edit": "true"},
+            0,
+            id="invalid-team",
+        ),
+        pytest.param(
+            "record1",
+            {"record_uid": "record1", "Test_can_edit": "invalid_value", "Test_can_share": "maybe"},
+            0,
+            id="invalid-values",
+        ),
+    ])
+    def test_permission_from_csv_row_negative(self, perm_fixtures, record_uid, row, expected_len):
+        """Test Permission.from_csv_row ignores unknown records, teams and values."""
+        permissions = Permission.from_csv_row(
+            perm_fixtures["teams"], perm_fixtures["records"], record_uid, row
+        )
+        assert len(permissions) == expected_len
     
     def test_validation_result_comprehensive(self):
         """Test ValidationResult model comprehensively."""
@@ -322,383 +414,219 @@ class TestModelCoverage:
         """Test VaultData model comprehensively."""
         vault_data = VaultData()
         
-        # Test initial state
-        assert len(vault_data.root_folders) == 0
-        assert len(vault_data.records_by_uid) == 0
-        assert len(vault_data.teams_by_uid) == 0
-        assert not vault_data.is_loaded()
-        
-        # Test summary
-        summary = vault_data.summary()
-        assert summary["teams"] == 0
-        assert summary["records"] == 0
-        assert summary["root_folders"] == 0
-        
-        # Test add_team
-        team = vault_data.add_team("team1", "Team One")
-        assert team.uid == "team1"
-        assert team.name == "Team One"
-        assert len(vault_data.teams_by_uid) == 1
-        
-        # Test add_record
-        record = vault_data.add_record("record1", "Record One", "/path1")
-        assert record.uid == "record1"
-        assert record.title == "Record One"
-        assert record.folder_path == "/path1"
-        assert len(vault_data.records_by_uid) == 1
-        
-        # Test add_folder (root folder)
-        root_folder = vault_data.add_folder("root1", "Root Folder")
-        assert root_folder.uid == "root1"
-        assert root_folder.name == "Root Folder"
-        assert root_folder.parent_uid is None
-        assert len(vault_data.root_folders) == 1
-        
-        # Test add_folder (child folder)
-        child_folder = vault_data.add_folder("child1", "Child Folder", "root1")
-        assert child_folder.uid == "child1"
-        assert child_folder.parent_uid == "root1"
-        assert len(root_folder.subfolders) == 1
-        
-        # Test find_folder_by_uid
-        found_root = vault_data.find_folder_by_uid("root1")
-        assert found_root is not None
-        assert found_root.uid == "root1"
-        
-        found_child = vault_data.find_folder_by_uid("child1")
-        assert found_child is not None
-        assert found_child.uid == "child1"
+        def snapshot():
+            return {
+                "teams": {uid: dataclasses.asdict(t) for uid, t in vault_data.teams_by_uid.items()},
+                "records": {uid: dataclasses.asdict(r) for uid, r in vault_data.records_by_uid.items()},
+                "folders": {
+                    uid: (f.name, f.parent_uid, [sub.uid for sub in f.subfolders])
+                    for uid, f in vault_data.folders_by_uid.items()
+                },
+                "loaded": vault_data.is_loaded(),
+            }
         
-        not_found = vault_data.find_folder_by_uid("nonexistent")
-        assert not_found is None
+        empty = {"teams": {}, "records": {}, "folders": {}, "loaded": False}
         
-        # Test get_team_by_name
-        found_team = vault_data.get_team_by_name("Team One")
-        assert found_team is not None
-        assert found_team.uid == "team1"
-        
-        not_found_team = vault_data.get_team_by_name("Nonexistent Team")
-        assert not_found_team is None
-        
-        # Test get_record_by_uid
-        found_record = vault_data.get_record_by_uid("record1")
-        assert found_record is not None
-        assert found_record.uid == "record1"
-        
-        not_found_record = vault_data.get_record_by_uid("nonexistent")
-        assert not_found_record is None
+        # Test initial state
+        assert snapshot() == empty
+        assert vault_data.summary() == EXPECTED_EMPTY_SUMMARY
         
-        # Test mark_loaded
+        vault_data.add_team("team1", "Team One")
+        vault_data.add_record("record1", "Record One", "/path1")
+        vault_data.add_folder("root1", "Root Folder")
+        vault_data.add_folder("child1", "Child Folder", "root1")
         vault_data.mark_loaded()
-        assert vault_data.is_loaded()
         
-        # Test updated summary
-        summary = vault_data.summary()
-        assert summary["teams"] == 1
-        assert summary["records"] == 1
-        assert summary["root_folders"] == 1
+        assert snapshot() == {
+            "teams": {"team1": {"uid": "team1", "name": "Team One"}},
+            "records": {
+                "record1": {"uid": "record1", "title": "Record One", "folder_path": "/path1"},
+            },
+            "folders": {
+                "root1": ("Root Folder", None, ["child1"]),
+                "child1": ("Child Folder", "root1", []),
+            },
+            "loaded": True,
+        }
+        assert vault_data.summary() == {"teams": 1, "records": 1, "folders": 2}
+        
+        # Lookups, keyed by "<getter>:<argument>" and reduced to the found UID
+        lookups = {
+            "folder:root1": vault_data.find_folder_by_uid("root1"),
+            "folder:child1": vault_data.find_folder_by_uid("child1"),
+            "folder:nonexistent": vault_data.find_folder_by_uid("nonexistent"),
+            "team:Team One": vault_data.get_team_by_name("Team One"),
+            "team:Nonexistent Team": vault_data.get_team_by_name("Nonexistent Team"),
+            "record:record1": vault_data.get_record_by_uid("record1"),
+            "record:nonexistent": vault_data.get_record_by_uid("nonexistent"),
+        }
+        assert {k: v.uid if v else None for k, v in lookups.items()} == {
+            "folder:root1": "root1",
+            "folder:child1": "child1",
+            "folder:nonexistent": None,
+            "team:Team One": "team1",
+            "team:Nonexistent Team": None,
+            "record:record1": "record1",
+            "record:nonexistent": None,
+        }
         
         # Test clear
         vault_data.clear()
-        assert len(vault_data.root_folders) == 0
-        assert len(vault_data.records_by_uid) == 0
-        assert len(vault_data.teams_by_uid) == 0
-        assert not vault_data.is_loaded()
+        assert snapshot() == empty
+
+
+@pytest.fixture(scope="module")
+def config_service():
+    """ConfigService holds no state, so one instance serves the module."""
+    return ConfigService()
 
 
 class TestConfigServiceCoverage:
     """Test ConfigService for full coverage."""
     
-    def test_load_configuration_no_uid_no_record(self):
-        """Test load_configuration when no config record exists."""
-        service = ConfigService()
-        
-        with patch('keeper_auto.services.get_records', return_value=[]):
-            result = service.load_configuration()
-            assert result.success
-            assert "not found" in result.message
-            assert isinstance(result.data, ConfigRecord)
-            assert len(result.warnings) == 1
+    def test_load_config_no_uid_no_record(self, config_service, keeper_backend):
+        """Test load_config falls back to defaults when no config record exists."""
+        assert config_service.load_config() == ConfigRecord()
     
-    def test_load_configuration_find_by_title_success(self):
-        """Test load_configuration finding config by title."""
-        service = ConfigService()
-        
-        mock_records = [
+    def test_load_config_find_by_title_success(self, config_service, keeper_backend):
+        """Test load_config finding config by title."""
+        keeper_backend.get_records_value = [
             {"uid": "other_uid", "title": "Other Record"},
             {"uid": "config_uid", "title": "Perms-Config"},
         ]
         
-        mock_field = Mock()
-        mock_field.type = 'json'
-        mock_field.value = '{"root_folder_name": "[Found]"}'
-        
-        mock_record = Mock()
-        mock_record.data = [mock_field]
-        
-        with patch('keeper_auto.services.get_records', return_value=mock_records), \
-             patch('keeper_auto.services.get_record', return_value=mock_record):
-            result = service.load_configuration()
-            assert result.success
-            assert result.data.root_folder_name == "[Found]"
-    
-    def test_load_configuration_with_uid_valid_json(self):
-        """Test load_configuration with valid JSON config."""
-        service = ConfigService()
-        
-        mock_field = Mock()
-        mock_field.type = 'json'
-        mock_field.value = json.dumps({
-            "root_folder_name": "[Test]",
-            "included_teams": ["team1"],
-            "included_folders": ["folder1"],
-            "excluded_folders": ["folder2"]
-        })
-        
-        mock_record = Mock()
-        mock_record.data = [mock_field]
-        
-        with patch('keeper_auto.services.get_record', return_value=mock_record):
-            result = service.load_configuration("test_uid")
-            assert result.success
-            assert result.data.root_folder_name == "[Test]"
-            assert result.data.included_teams == ["team1"]
-            assert result.data.included_folders == ["folder1"]
-            assert result.data.excluded_folders == ["folder2"]
-    
-    def test_load_configuration_invalid_json(self):
-        """Test load_configuration with invalid JSON."""
-        service = ConfigService()
-        
-        mock_field = Mock()
-        mock_field.type = 'json'
-        mock_field.value = 'invalid json{'
-        
-        mock_record = Mock()
-        mock_record.data = [mock_field]
-        
-        with patch('keeper_auto.services.get_record', return_value=mock_record):
-            result = service.load_configuration("test_uid")
-            assert not result.success
-            assert "Failed to parse" in result.message
-            assert len(result.errors) == 1
-    
-    def test_load_configuration_empty_record(self):
-        """Test load_configuration with empty record."""
-        service = ConfigService()
-        
-        mock_record = Mock()
-        mock_record.data = []
-        
-        with patch('keeper_auto.services.get_record', return_value=mock_record):
-            result = service.load_configuration("test_uid")
-            assert result.success
-            assert "empty" in result.message
-            assert len(result.warnings) == 1
-    
-    def test_load_configuration_no_json_field(self):
-        """Test load_configuration with no JSON field."""
-        service = ConfigService()
-        
-        mock_field = Mock()
-        mock_field.type = 'text'
-        mock_field.value = 'some text'
-        
-        mock_record = Mock()
-        mock_record.data = [mock_field]
-        
-        with patch('keeper_auto.services.get_record', return_value=mock_record):
-            result = service.load_configuration("test_uid")
-            assert result.success
-            assert "empty" in result.message
-            assert len(result.warnings) == 1
-    
-    def test_load_configuration_api_exception(self):
-        """Test load_configuration with API exception."""
-        service = ConfigService()
-        
-        with patch('keeper_auto.services.get_record', side_effect=Exception("API Error")):
-            result = service.load_configuration("test_uid")
-            assert not result.success
-            assert "Could not load configuration" in result.message
-            assert len(result.errors) == 1
-    
-    def test_find_config_record_by_title_exception(self):
+        keeper_backend.get_record_value = _FakeRecord([_FakeField('json', '{"root_folder_name": "[Found]"}')])
+        
+        config = config_service.load_config()
+        assert config.root_folder_name == "[Found]"
+    
+    def test_load_config_with_uid_valid_json(self, config_service, keeper_backend):
+        """Test load_config with valid JSON config."""
+        keeper_backend.get_record_value = _FakeRecord([_FakeField('json', _VALID_CONFIG_JSON)])
+        
+        assert config_service.load_config("test_uid") == ConfigRecord(
+            root_folder_name="[Test]",
+            included_teams=["team1"],
+            included_folders=["folder1"],
+            excluded_folders=["folder2"],
+        )
+    
+    def test_load_config_invalid_json(self, config_service, keeper_backend):
+        """Test load_config returns None for unparseable JSON."""
+        keeper_backend.get_record_value = _FakeRecord([_FakeField('json', 'invalid json{')])
+        
+        assert config_service.load_config("test_uid") is None
+    
+    def test_load_config_empty_record(self, config_service, keeper_backend):
+        """Test load_config falls back to defaults for an empty record."""
+        keeper_backend.get_record_value = _FakeRecord([])
+        
+        assert config_service.load_config("test_uid") == ConfigRecord()
+    
+    def test_load_config_no_json_field(self, config_service, keeper_backend):
+        """Test load_config falls back to defaults when no field holds JSON."""
+        keeper_backend.get_record_value = _FakeRecord([_FakeField('text', 'some text')])
+        
+        assert config_service.load_config("test_uid") == ConfigRecord()
+    
+    def test_load_config_api_exception(self, config_service, keeper_backend):
+        """Test load_config returns None when fetching the record fails."""
+        keeper_backend.get_record_exc = Exception("API Error")
+        
+        assert config_service.load_config("test_uid") is None
+    
+    def test_find_config_record_by_title_exception(self, config_service, keeper_backend):
         """Test _find_config_record_by_title with exception."""
-        service = ConfigService()
+        keeper_backend.get_records_exc = Exception("Search failed")
         
-        with patch('keeper_auto.services.get_records', side_effect=Exception("Search failed")):
-            result = service._find_config_record_by_title()
-            assert result is None
+        result = config_service._find_config_record_by_title()
+        assert result is None
     
-    def test_find_config_record_by_title_custom_title(self):
+    def test_find_config_record_by_title_custom_title(self, config_service, keeper_backend):
         """Test _find_config_record_by_title with custom title."""
-        service = ConfigService()
-        
-        mock_records = [
+        keeper_backend.get_records_value = [
             {"uid": "config_uid", "title": "Custom-Config"},
         ]
         
-        with patch('keeper_auto.services.get_records', return_value=mock_records):
-            result = service._find_config_record_by_title("Custom-Config")
-            assert result == "config_uid"
+        result = config_service._find_config_record_by_title("Custom-Config")
+        assert result == "config_uid"
 
 
 class TestVaultServiceCoverage:
     """Test VaultService for full coverage."""
     
-    def test_load_vault_data_cached(self):
+    def test_load_vault_data_cached(self, vault_service):
         """Test load_vault_data returns cached data."""
-        service = VaultService()
-        service.vault_data.mark_loaded()
+        vault_service.vault_data.mark_loaded()
         
-        result = service.load_vault_data()
+        result = vault_service.load_vault_data()
         assert result.is_loaded()
     
-    def test_load_vault_data_force_reload(self):
-        """Test load_vault_data with force_reload."""
-        service = VaultService()
-        service.vault_data.mark_loaded()
-        
-        mock_folder_data = {
-            "folders": [
-                {"uid": "folder1", "name": "Folder 1", "parent_uid": None}
-            ],
-            "records": [
-                {"uid": "record1", "title": "Record 1", "folder_uid": "folder1"}
-            ]
-        }
-        mock_teams = [
-            {"team_uid": "team1", "team_name": "Team 1"}
-        ]
-        
-        with patch('keeper_auto.services.get_folder_data', return_value=mock_folder_data), \
-             patch('keeper_auto.services.get_teams', return_value=mock_teams):
-            result = service.load_vault_data(force_reload=True)
-            assert result.is_loaded()
-            assert len(result.teams_by_uid) == 1
-            assert len(result.records_by_uid) == 1
-    
-    def test_load_vault_data_with_config_filtering(self):
-        """Test load_vault_data with config filtering."""
-        service = VaultService()
-        
-        config = ConfigRecord(
-            included_teams=["team1"],
-            included_folders=["folder1"],
-            excluded_folders=["folder2"]
+    @pytest.mark.parametrize("case", [
+        pytest.param(
+            c, id=c.name,
+            marks=pytest.mark.xfail(strict=True, reason=c.xfail) if c.xfail else (),
         )
+        for c in VAULT_LOAD_CASES
+    ])
+    def test_load_vault_data(self, keeper_backend, case):
+        """Test load_vault_data against canned vault API responses."""
+        vault_service = VaultService(case.config)
+        if case.force_reload:
+            vault_service.vault_data.mark_loaded()
+        
+        keeper_backend.get_folder_data_value = case.folders
+        keeper_backend.get_teams_value = case.teams
+        keeper_backend.get_folder_data_exc = case.api_exc
+        
+        result = vault_service.load_vault_data(force_reload=case.force_reload)
+        if case.api_exc:
+            assert result is None
+            return
         
-        mock_folder_data = {
-            "folders": [
-                {"uid": "folder1", "name": "Included Folder", "parent_uid": None},
-                {"uid": "folder2", "name": "Excluded Folder", "parent_uid": None},
-                {"uid": "folder3", "name": "Not Included Folder", "parent_uid": None}
-            ],
-            "records": [
-                {"uid": "record1", "title": "Record 1", "folder_uid": "folder1"}
-            ]
-        }
-        mock_teams = [
-            {"team_uid": "team1", "team_name": "Included Team"},
-            {"team_uid": "team2", "team_name": "Not Included Team"}
-        ]
-        
-        with patch('keeper_auto.services.get_folder_data', return_value=mock_folder_data), \
-             patch('keeper_auto.services.get_teams', return_value=mock_teams):
-            result = service.load_vault_data(config=config)
-            
-            # Should only include team1 (in included_teams)
-            assert len(result.teams_by_uid) == 1
-            assert "team1" in result.teams_by_uid
-            
-            # Should only include folder1 (in included_folders, folder2 is excluded)
-            assert len(result.root_folders) == 1
-            assert result.root_folders[0].uid == "folder1"
-    
-    def test_load_vault_data_missing_uids(self):
-        """Test load_vault_data with missing UIDs."""
-        service = VaultService()
-        
-        mock_folder_data = {
-            "folders": [
-                {"name": "Folder 1", "parent_uid": None},  # Missing uid
-                {"uid": "folder2", "parent_uid": None}      # Missing name
-            ],
-            "records": [
-                {"title": "Record 1", "folder_uid": "folder1"},  # Missing uid
-                {"uid": "record2", "folder_uid": "folder1"}       # Missing title
-            ]
-        }
-        mock_teams = [
-            {"team_name": "Team 1"},  # Missing team_uid
-            {"team_uid": "team2"}     # Missing team_name
-        ]
-        
-        with patch('keeper_auto.services.get_folder_data', return_value=mock_folder_data), \
-             patch('keeper_auto.services.get_teams', return_value=mock_teams):
-            result = service.load_vault_data()
-            
-            # Should skip items with missing required fields
-            assert len(result.teams_by_uid) == 0
-            assert len(result.root_folders) == 0
-            assert len(result.records_by_uid) == 0
-    
-    def test_load_vault_data_api_exception(self):
-        """Test load_vault_data with API exception."""
-        service = VaultService()
-        
-        with patch('keeper_auto.services.get_folder_data', side_effect=Exception("API Error")):
-            with pytest.raises(APIError):
-                service.load_vault_data()
-    
-    def test_build_folder_path_complex_hierarchy(self):
+        assert result.is_loaded()
+        if case.expect_teams is not None:
+            assert sorted(result.teams_by_uid) == case.expect_teams
+        if case.expect_folders is not None:
+            assert sorted(result.folders_by_uid) == case.expect_folders
+        if case.expect_records is not None:
+            assert sorted(result.records_by_uid) == case.expect_records
+    
+    def test_build_folder_path_complex_hierarchy(self, vault_service):
         """Test _build_folder_path with complex hierarchy."""
-        service = VaultService()
-        
         # Build complex folder hierarchy
-        service.vault_data.add_folder("root", "Root")
-        service.vault_data.add_folder("level1", "Level1", "root")
-        service.vault_data.add_folder("level2", "Level2", "level1")
-        service.vault_data.add_folder("level3", "Level3", "level2")
+        vault_service.vault_data.add_folder("root", "Root")
+        vault_service.vault_data.add_folder("level1", "Level1", "root")
+        vault_service.vault_data.add_folder("level2", "Level2", "level1")
+        vault_service.vault_data.add_folder("level3", "Level3", "level2")
         
-        path = service._build_folder_path("level3")
+        path = vault_service._build_folder_path("level3")
         assert path == "/Root/Level1/Level2/Level3"
         
-        path = service._build_folder_path("level1")
+        path = vault_service._build_folder_path("level1")
         assert path == "/Root/Level1"
         
-        path = service._build_folder_path("root")
+        path = vault_service._build_folder_path("root")
         assert path == "/Root"
     
-    def test_build_folder_path_edge_cases(self):
+    def test_build_folder_path_edge_cases(self, vault_service):
         """Test _build_folder_path edge cases."""
-        service = VaultService()
-        
         # Test with None
-        path = service._build_folder_path(None)
+        path = vault_service._build_folder_path(None)
         assert path == ""
         
         # Test with nonexistent folder
-        path = service._build_folder_path("nonexistent")
+        path = vault_service._build_folder_path("nonexistent")
         assert path == ""
         
         # Test with broken hierarchy (missing parent)
-        service.vault_data.add_folder("orphan", "Orphan", "missing_parent")
-        path = service._build_folder_path("orphan")
+        vault_service.vault_data.add_folder("orphan", "Orphan", "missing_parent")
+        path = vault_service._build_folder_path("orphan")
         assert path == "/Orphan"
     
-    def test_get_vault_summary_not_loaded(self):
-        """Test get_vault_summary when not loaded."""
-        service = VaultService()
-        
-        mock_folder_data = {"folders": [], "records": []}
-        mock_teams = []
+    def test_vault_summary_after_empty_load(self, vault_service, keeper_backend):
+        """Test the summary after loading from an empty vault."""
+        vault_service.load_vault_data()
         
-        with patch('keeper_auto.services.get_folder_data', return_value=mock_folder_data), \
-             patch('keeper_auto.services.get_teams', return_value=mock_teams):
-            summary = service.get_vault_summary()
-            assert isinstance(summary, dict)
-            assert "teams" in summary
-            assert "records" in summary
-            assert "root_folders" in summary 
\ No newline at end of file
+        assert vault_service.vault_data.is_loaded()
+        assert vault_service.vault_data.summary() == EXPECTED_EMPTY_SUMMARY 
\ No newline at end of file
@@ -1,87 +1,93 @@
 """Tests for Keeper client functionality."""
 
 import pytest
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
 from keeper_auto.keeper_client import get_record, get_teams, get_records, find_team_by_name
 
 
+# Teams returned by the stubbed get_teams(); shared, never mutated.
+TEAMS = [
+    {'team_uid': 'team1', 'team_name': 'Team 1'},
+    {'team_uid': 'team2', 'team_name': 'Team 2'}
+]
+
+
+@pytest.fixture(autouse=True)
+def _reset_fake_sdk(fake_sdk):
+    """Give each test empty caches (re-creating any attribute a test deleted)."""
+    fake_sdk.record_cache = {}
+    fake_sdk.team_cache = {}
+
+
+@pytest.fixture
+def get_client_calls(monkeypatch, fake_sdk):
+    """Route get_client() to fake_sdk and record each call."""
+    calls = []
+
+    def _get_client():
+        calls.append(None)
+        return fake_sdk
+
+    monkeypatch.setattr("keeper_auto.keeper_client.get_client", _get_client)
+    return calls
+
+
 class TestKeeperClient:
     """Test Keeper client API functions."""
     
-    @patch('keeper_auto.keeper_client.get_client')
-    def test_get_record_success(self, mock_get_client):
+    def test_get_record_success(self, get_client_calls, fake_sdk):
         """Test successful record retrieval."""
-        # Mock the SDK and record cache
-        mock_sdk = MagicMock()
-        mock_sdk.record_cache = {
-            'test_uid': MagicMock(uid='test_uid', title='Test Record')
-        }
-        mock_get_client.return_value = mock_sdk
+        # Populate the SDK record cache
+        fake_sdk.record_cache['test_uid'] = SimpleNamespace(uid='test_uid', title='Test Record')
         
         # Test the function
         result = get_record('test_uid')
         
         # Verify
         assert result is not None
-        mock_get_client.assert_called_once()
+        assert len(get_client_calls) == 1
     
-    @patch('keeper_auto.keeper_client.get_client')
-    def test_get_record_not_found(self, mock_get_client):
+    def test_get_record_not_found(self, get_client_calls, fake_sdk):
         """Test record not found scenario."""
-        # Mock the SDK with empty cache
-        mock_sdk = MagicMock()
-        mock_sdk.record_cache = {}
-        mock_get_client.return_value = mock_sdk
+        # SDK with empty cache
         
         # Test the function should return None
         result = get_record('nonexistent_uid')
         assert result is None
     
-    @patch('keeper_auto.keeper_client.get_client')
-    def test_get_teams_success(self, mock_get_client):
+    def test_get_teams_success(self, get_client_calls, fake_sdk):
         """Test successful teams retrieval."""
-        # Mock the SDK and team cache
-        mock_sdk = MagicMock()
-        mock_sdk.team_cache = {
+        # Populate the SDK team cache
+        fake_sdk.team_cache.update({
             'team1': {'team_uid': 'team1', 'team_name': 'Team 1'},
             'team2': {'team_uid': 'team2', 'team_name': 'Team 2'}
-        }
-        mock_get_client.return_value = mock_sdk
+        })
         
         # Test the function
         result = get_teams()
         
         # Verify
         assert len(result) == 2
-        mock_get_client.assert_called_once()
+        assert len(get_client_calls) == 1
     
-    @patch('keeper_auto.keeper_client.get_client')
-    def test_get_teams_no_cache(self, mock_get_client):
+    def test_get_teams_no_cache(self, get_client_calls, fake_sdk):
         """Test teams retrieval with no cache."""
-        # Mock the SDK with no team cache
-        mock_sdk = MagicMock()
-        delattr(mock_sdk, 'team_cache')  # Remove the attribute
-        mock_get_client.return_value = mock_sdk
+        # SDK with no team cache
+        del fake_sdk.team_cache
         
         # Test the function
         result = get_teams()
         
         # Verify returns empty list
         assert result == []
-        mock_get_client.assert_called_once()
+        assert len(get_client_calls) == 1
     
-    @patch('keeper_auto.keeper_client.get_client')
-    def test_get_records_success(self, mock_get_client):
+    def test_get_records_success(self, get_client_calls, fake_sdk):
         """Test successful records retrieval."""
-        # Mock the SDK and record cache
-        mock_record = MagicMock()
-        mock_record.uid = 'record1'
-        mock_record.title = 'Test Record'
-        mock_record.folder_uid = 'folder1'
-        
-        mock_sdk = MagicMock()
-        mock_sdk.record_cache = {'record1': mock_record}
-        mock_get_client.return_value = mock_sdk
+        # Populate the SDK record cache
+        fake_sdk.record_cache['record1'] = {
+            'uid': 'record1', 'title': 'Test Record', 'folder_uid': 'folder1'
+        }
         
         # Test the function
         result = get_records()
@@ -91,39 +97,24 @@ class TestKeeperClient:
         assert result[0]['uid'] == 'record1'
         assert result[0]['title'] == 'Test Record'
         assert result[0]['folder_uid'] == 'folder1'
-        mock_get_client.assert_called_once()
+        assert len(get_client_calls) == 1
     
-    @patch('keeper_auto.keeper_client.get_teams')
-    def test_find_team_by_name_success(self, mock_get_teams):
-        """Test successful team finding by name."""
-        # Mock teams data
-        mock_get_teams.return_value = [
-            {'team_uid': 'team1', 'team_name': 'Team 1'},
-            {'team_uid': 'team2', 'team_name': 'Team 2'}
-        ]
-        
-        # Test the function
-        result = find_team_by_name('Team 1')
+    @pytest.mark.parametrize("name,expected_uid", [
+        ("Team 1", "team1"),
+        ("Nonexistent Team", None),
+    ], ids=["found", "not-found"])
+    def test_find_team_by_name(self, monkeypatch, name, expected_uid):
+        """Test team lookup by name."""
+        monkeypatch.setattr("keeper_auto.keeper_client.get_teams", lambda: TEAMS)
         
-        # Verify
-        assert result is not None
-        assert result['team_uid'] == 'team1'
-        assert result['team_name'] == 'Team 1'
-    
-    @patch('keeper_auto.keeper_client.get_teams')
-    def test_find_team_by_name_not_found(self, mock_get_teams):
-        """Test team not found by name."""
-        # Mock teams data
-        mock_get_teams.return_value = [
-            {'team_uid': 'team1', 'team_name': 'Team 1'}
-        ]
+        result = find_team_by_name(name)
         
-        # Test the function
-        result = find_team_by_name('Nonexistent Team')
-        
-        # Verify
-        assert result is None
-
+        if expected_uid is None:
+            assert result is None
+        else:
+            assert result is not None
+            assert result['team_uid'] == expected_uid
+            assert result['team_name'] == name
 
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file
@@ -2,154 +2,129 @@
 Comprehensive tests for models to improve code coverage.
 """
 
+import functools
+
 import pytest
-from keeper_auto.models import VaultData, ValidationResult, OperationResult, CSVTemplate, ConfigRecord, Record, Team, VaultFolder
-from keeper_auto.exceptions import APIError, AuthenticationError, ConfigurationError, ValidationError, OperationError, DataError, NetworkError, PermissionError
+from keeper_auto.models import VaultData, ValidationResult, CSVTemplate, ConfigRecord, Record, Team, VaultFolder
+from keeper_auto.exceptions import APIError, KeeperAutomationError
+from tests.constants import (
+    EXPECTED_EMPTY_SUMMARY, FOLDER_NAME, FOLDER_UID, RECORD_PATH, RECORD_TITLE, RECORD_UID,
+    TEAM_NAME, TEAM_UID,
+)
+
+# Every direct KeeperAutomationError subclass, so new ones are tested automatically.
+# APIError has its own tests because it also carries error_code.
+EXC_CLASSES = [cls for cls in KeeperAutomationError.__subclasses__() if cls is not APIError]
+
+
+@functools.lru_cache(maxsize=None)
+def _exc(cls, msg, code=None):
+    """Build (once per argument tuple) an exception that is only inspected, never raised."""
+    return cls(msg, error_code=code) if code else cls(msg)
 
 
 class TestExceptions:
     """Test all exception classes for coverage."""
     
     def test_api_error_with_code(self):
-        error = APIError("Test error", error_code="E001")
+        error = _exc(APIError, "Test error", "E001")
         assert str(error) == "Test error"
         assert error.error_code == "E001"
     
     def test_api_error_without_code(self):
-        error = APIError("Test error")
+        error = _exc(APIError, "Test error")
         assert str(error) == "Test error"
         assert error.error_code is None
     
-    def test_authentication_error(self):
-        error = AuthenticationError("Auth failed")
-        assert str(error) == "Auth failed"
-    
-    def test_configuration_error(self):
-        error = ConfigurationError("Config error") 
-        assert str(error) == "Config error"
-    
-    def test_validation_error(self):
-        error = ValidationError("Validation failed")
-        assert str(error) == "Validation failed"
-    
-    def test_operation_error(self):
-        error = OperationError("Operation failed")
-        assert str(error) == "Operation failed"
-    
-    def test_data_error(self):
-        error = DataError("Data error")
-        assert str(error) == "Data error"
-    
-    def test_network_error(self):
-        error = NetworkError("Network error")
-        assert str(error) == "Network error"
-    
-    def test_permission_error(self):
-        error = PermissionError("Permission denied")
-        assert str(error) == "Permission denied"
+    @pytest.mark.parametrize("cls", EXC_CLASSES, ids=[cls.__name__ for cls in EXC_CLASSES])
+    def test_exception_str(self, cls):
+        assert str(_exc(cls, "Test error")) == "Test error"
 
 
 class TestModelClasses:
     """Test individual model classes."""
     
-    def test_vault_record_model(self):
-        record = Record(uid="uid1", title="Title", folder_path="/path")
-        assert record.uid == "uid1"
-        assert record.title == "Title"
-        assert record.folder_path == "/path"
-    
-    def test_team_model(self):
-        team = Team(uid="team1", name="Team One")
-        assert team.uid == "team1"
-        assert team.name == "Team One"
-    
-    def test_folder_model(self):
-        folder = VaultFolder(uid="folder1", name="Folder One", parent_uid="parent1")
-        assert folder.uid == "folder1"
-        assert folder.name == "Folder One"
-        assert folder.parent_uid == "parent1"
-        
-        # Test folder without parent
-        root_folder = VaultFolder(uid="root", name="Root", parent_uid=None)
-        assert root_folder.parent_uid is None
+    @pytest.mark.parametrize("cls,kwargs", [
+        (Record, {"uid": "uid1", "title": "Title", "folder_path": "/path"}),
+        (Team, {"uid": "team1", "name": "Team One"}),
+        (VaultFolder, {"uid": "folder1", "name": "Folder One", "parent_uid": "parent1"}),
+        (VaultFolder, {"uid": "root", "name": "Root", "parent_uid": None}),
+    ], ids=["record", "team", "folder", "root-folder"])
+    def test_dataclass_roundtrip(self, cls, kwargs):
+        obj = cls(**kwargs)
+        assert {key: getattr(obj, key) for key in kwargs} == kwargs
 
 
 class TestVaultData:
     """Test VaultData model comprehensively."""
     
-    def test_initial_state(self):
-        vault_data = VaultData()
-        assert not vault_data.is_loaded()
-        assert vault_data.summary() == {"teams": 0, "folders": 0, "records": 0}
-        assert vault_data.get_team_by_uid("nonexistent") is None
-        assert vault_data.find_folder_by_uid("nonexistent") is None
-        assert vault_data.get_record_by_uid("nonexistent") is None
+    def test_initial_state(self, empty_vault):
+        assert not empty_vault.is_loaded()
+        assert empty_vault.summary() == EXPECTED_EMPTY_SUMMARY
+        assert empty_vault.get_team_by_uid("nonexistent") is None
+        assert empty_vault.get_team_by_name("nonexistent") is None
+        assert empty_vault.find_folder_by_uid("nonexistent") is None
+        assert empty_vault.get_record_by_uid("nonexistent") is None
     
-    def test_add_and_retrieve_data(self):
+    def test_add_returns_models(self):
         vault_data = VaultData()
         
-        # Add data
-        vault_data.add_team("team1", "Team One")
-        vault_data.add_folder("folder1", "Folder One", None)
-        vault_data.add_record("record1", "Record One", "/path")
-        
-        # Test retrieval
-        team = vault_data.get_team_by_uid("team1")
-        assert team is not None
-        assert team.name == "Team One"
-        
-        folder = vault_data.find_folder_by_uid("folder1")
-        assert folder is not None
-        assert folder.name == "Folder One"
-        
-        record = vault_data.get_record_by_uid("record1")
-        assert record is not None
-        assert record.title == "Record One"
-        
-        # Test summary
-        summary = vault_data.summary()
-        assert summary["teams"] == 1
-        assert summary["folders"] == 1
-        assert summary["records"] == 1
+        assert vault_data.add_team(TEAM_UID, TEAM_NAME).name == TEAM_NAME
+        assert vault_data.add_folder(FOLDER_UID, FOLDER_NAME).parent_uid is None
+        assert vault_data.add_record(RECORD_UID, RECORD_TITLE, RECORD_PATH).title == RECORD_TITLE
+    
+    @pytest.mark.parametrize("getter,arg,attr,expected", [
+        ("get_team_by_uid", TEAM_UID, "name", TEAM_NAME),
+        ("get_team_by_name", TEAM_NAME, "uid", TEAM_UID),
+        ("find_folder_by_uid", FOLDER_UID, "name", FOLDER_NAME),
+        ("get_record_by_uid", RECORD_UID, "title", RECORD_TITLE),
+    ], ids=["team-by-uid", "team-by-name", "folder-by-uid", "record-by-uid"])
+    def test_retrieve(self, populated_vault, getter, arg, attr, expected):
+        obj = getattr(populated_vault, getter)(arg)
+        assert obj is not None
+        assert getattr(obj, attr) == expected
+    
+    def test_populated_summary(self, populated_vault):
+        assert populated_vault.summary() == {"teams": 2, "folders": 1, "records": 2}
     
     def test_mark_loaded_and_clear(self):
         vault_data = VaultData()
         
         # Add some data
-        vault_data.add_team("team1", "Team One")
+        vault_data.add_team(TEAM_UID, TEAM_NAME)
         vault_data.mark_loaded()
         assert vault_data.is_loaded()
         
         # Clear data
         vault_data.clear()
         assert not vault_data.is_loaded()
-        assert len(vault_data.teams_by_uid) == 0
-        assert len(vault_data.folders_by_uid) == 0
-        assert len(vault_data.records_by_uid) == 0
+        assert vault_data.summary() == EXPECTED_EMPTY_SUMMARY
 
 
 class TestValidationResult:
     """Test ValidationResult model."""
     
-    def test_initial_state(self):
-        result = ValidationResult()
-        assert result.is_valid
-        assert len(result.errors) == 0
-        assert len(result.warnings) == 0
-        assert result.metadata == {}
-    
-    def test_add_errors_and_warnings(self):
-        result = ValidationResult()
-        
-        result.add_error("Error 1")
-        result.add_error("Error 2")
-        result.add_warning("Warning 1")
+    def test_initial_state(self, empty_validation_result):
+        assert empty_validation_result.is_valid
+        assert empty_validation_result.errors == []
+        assert empty_validation_result.warnings == []
+        assert empty_validation_result.metadata == {}
+    
+    @pytest.mark.parametrize("actions,is_valid,has_issues", [
+        ([], True, False),
+        ([("error", "E1")], False, True),
+        ([("warning", "W1")], True, True),
+        ([("error", "E1"), ("error", "E2"), ("warning", "W1")], False, True),
+    ], ids=["untouched", "error", "warning", "errors-and-warning"])
+    def test_validation_state(self, actions, is_valid, has_issues):
+        result = ValidationResult(is_valid=True)
+        for kind, message in actions:
+            getattr(result, f"add_{kind}")(message)
         
-        assert not result.is_valid
-        assert len(result.errors) == 2
-        assert len(result.warnings) == 1
-        assert "Error 1" in result.errors
-        assert "Warning 1" in result.warnings
+        assert result.is_valid == is_valid
+        assert result.has_issues() == has_issues
+        assert result.errors == [message for kind, message in actions if kind == "error"]
+        assert result.warnings == [message for kind, message in actions if kind == "warning"]
     
     def test_constructor_with_params(self):
         result = ValidationResult(
@@ -159,35 +134,30 @@ class TestValidationResult:
             metadata={"key": "value"}
         )
         assert not result.is_valid
-        assert "Initial error" in result.errors
-        assert "Initial warning" in result.warnings
-        assert result.metadata["key"] == "value"
+        assert result.errors == ["Initial error"]
+        assert result.warnings == ["Initial warning"]
+        assert result.metadata == {"key": "value"}
 
 
 class TestOperationResult:
     """Test OperationResult model."""
     
-    def test_minimal_result(self):
-        result = OperationResult(success=True, message="Success")
-        assert result.success
-        assert result.message == "Success"
-        assert result.data is None
-        assert len(result.errors) == 0
-        assert len(result.warnings) == 0
-    
-    def test_full_result(self):
-        result = OperationResult(
-            success=False,
-            message="Failed",
-            data={"key": "value"},
-            errors=["Error 1", "Error 2"],
-            warnings=["Warning 1"]
-        )
-        assert not result.success
-        assert result.message == "Failed"
-        assert result.data["key"] == "value"
-        assert len(result.errors) == 2
-        assert len(result.warnings) == 1
+    def test_minimal_result(self, minimal_op_result):
+        assert minimal_op_result.success
+        assert minimal_op_result.message == "Success"
+        assert minimal_op_result.data is None
+        assert minimal_op_result.errors == []
+        assert minimal_op_result.warnings == []
+    
+    @pytest.mark.parametrize("attr,expected", [
+        ("success", False),
+        ("message", "Failed"),
+        ("data", {"key": "value"}),
+        ("errors", ["Error 1", "Error 2"]),
+        ("warnings", ["Warning 1"]),
+    ], ids=["success", "message", "data", "errors", "warnings"])
+    def test_full_result(self, full_op_result, attr, expected):
+        assert getattr(full_op_result, attr) == expected
 
 
 class TestCSVTemplate:
@@ -199,68 +169,59 @@ class TestCSVTemplate:
         assert template.headers == expected_headers
         assert len(template.rows) == 0
     
-    def test_add_rows(self):
-        template = CSVTemplate()
+    @pytest.mark.parametrize("uid,title,path,team_names", [
+        pytest.param("uid1", "Title 1", "/path1", ["Team1", "Team2"], id="two_teams"),
+        pytest.param("uid2", "Title 2", "/path2", ["Team1"], id="one_team"),
+        pytest.param("uid3", "Title 3", "/path3", [], id="no_perms"),
+    ])
+    def test_generate_row(self, uid, title, path, team_names):
+        teams = [Team(uid=f"team-{name}", name=name) for name in team_names]
+        template = CSVTemplate(teams=teams)
         
-        # Add first row
-        template.add_row("uid1", "Title 1", "/path1", {"Team1": "ro", "Team2": "rw"})
-        assert len(template.rows) == 1
+        row = template.generate_row(Record(uid=uid, title=title, folder_path=path))
         
-        row1 = template.rows[0]
-        assert row1["record_uid"] == "uid1"
-        assert row1["title"] == "Title 1"
-        assert row1["folder_path"] == "/path1"
-        assert row1["Team1"] == "ro"
-        assert row1["Team2"] == "rw"
-        
-        # Add second row with different teams
-        template.add_row("uid2", "Title 2", "/path2", {"Team1": "rws"})
-        assert len(template.rows) == 2
+        assert row == {
+            "record_uid": uid, "title": title, "folder_path": path,
+            **dict.fromkeys(team_names, ""),
+        }
+        assert list(row) == template.generate_headers()
+    
+    def test_generate_rows_accumulate(self):
+        template = CSVTemplate(
+            teams=[Team(uid="t1", name="Team1"), Team(uid="t2", name="Team2")],
+            records=[Record("uid1", "Title 1", "/path1"), Record("uid2", "Title 2", "/path2")],
+        )
         
-        row2 = template.rows[1]
-        assert row2["record_uid"] == "uid2"
-        assert row2["Team1"] == "rws"
-        assert "Team2" not in row2  # Should not have Team2 permission
-    
-    def test_add_row_no_permissions(self):
-        template = CSVTemplate()
-        template.add_row("uid1", "Title 1", "/path1", {})
+        rows = [template.generate_row(record) for record in template.records]
         
-        assert len(template.rows) == 1
-        row = template.rows[0]
-        assert row["record_uid"] == "uid1"
-        assert row["title"] == "Title 1"
-        assert row["folder_path"] == "/path1"
+        assert [row["record_uid"] for row in rows] == ["uid1", "uid2"]
+        assert all(list(row) == template.generate_headers() for row in rows)
 
 
 class TestConfigRecord:
     """Test ConfigRecord model."""
     
-    def test_default_values(self):
-        config = ConfigRecord()
-        assert config.root_folder_name == "[Perms]"
-        assert config.included_teams is None
-        assert config.included_folders is None
-        assert config.excluded_folders == []
-    
-    def test_custom_values(self):
-        config = ConfigRecord(
-            root_folder_name="[Custom]",
-            included_teams=["team1", "team2"],
-            included_folders=["folder1"],
-            excluded_folders=["folder2", "folder3"]
-        )
-        assert config.root_folder_name == "[Custom]"
-        assert config.included_teams == ["team1", "team2"]
-        assert config.included_folders == ["folder1"]
-        assert config.excluded_folders == ["folder2", "folder3"]
-    
-    def test_partial_custom_values(self):
-        config = ConfigRecord(
-            root_folder_name="[Partial]",
-            included_teams=["team1"]
-        )
-        assert config.root_folder_name == "[Partial]"
-        assert config.included_teams == ["team1"]
-        assert config.included_folders is None  # Should remain None
-        assert config.excluded_folders == []    # Should remain default 
\ No newline at end of file
+    @pytest.mark.parametrize("kwargs,expected", [
+        ({}, ("[Perms]", None, None, [])),
+        (
+            {
+                "root_folder_name": "[Custom]",
+                "included_teams": ["team1", "team2"],
+                "included_folders": ["folder1"],
+                "excluded_folders": ["folder2", "folder3"],
+            },
+            ("[Custom]", ["team1", "team2"], ["folder1"], ["folder2", "folder3"]),
+        ),
+        (
+            {"root_folder_name": "[Partial]", "included_teams": ["team1"]},
+            ("[Partial]", ["team1"], None, []),
+        ),
+    ], ids=["default", "custom", "partial"])
+    def test_values(self, kwargs, expected):
+        config = ConfigRecord(**kwargs)
+        assert (
+            config.root_folder_name,
+            config.included_teams,
+            config.included_folders,
+            config.excluded_folders,
+        ) == expected 
\ No newline at end of file